@@ -1,35 +1,50 @@
+import numpy as np
+
+
+def check_n_cavers(n_cavers, name='n_cavers'):
+    ''' Checks that the number of cavers (a single group size or an array of them) are integers of at least 1.
+
+        Parameters:
+        n_cavers (int or array of int): the number of cavers in the group
+        name (str, optional): the argument name used in the error message (default is 'n_cavers')
+
+        Returns:
+        n_cavers (array): the number of cavers as a NumPy array        '''
+
+    n_cavers = np.asarray(n_cavers)
+    if not np.issubdtype(n_cavers.dtype, np.integer) or np.any(n_cavers < 1):
+        raise ValueError(f'{name} must be an integer of at least 1')
+
+    return n_cavers
+
+
+
 def ascent_time(rope_length, n_cavers, n_rebelays=0, ascent_speed=7, transition_time=2):
     ''' Ascent or descent simulator: calculates the time it would take for a party of cavers
         to ascend or descend a rope with a number of equally spaced rebelays.
 
         Parameters:
         rope_length (float): the total length of the rope in meters
-        n_cavers (int): the number of cavers in the group
-        n_rebelays (int): number of rebelays. 0 means that no rebelays are set up (i.e., the full length is climbed)
+        n_cavers (int or array of int): the number of cavers in the group
+        n_rebelays (int or array of int): number of rebelays. 0 means that no rebelays are set up (i.e., the full length is climbed)
         ascent_speed (float, optional): the ascent or descent speed in meters per minute (default is 7 for ascent, 70 is suggested for descent)
         transition_time (float, optional): the time it takes for a caver to transition from one rebelay to the next in minutes (default is 2)
 
         Returns:
-        total_time (float): the total time taken by the group to complete the ascent or descent        '''
+        total_time (float or array): the total time taken by the group to complete the ascent or descent        '''
 
-    # Check input
-    if not isinstance(n_cavers, int) or n_cavers < 1:
-        raise ValueError('n_cavers must be an integer of at least 1')
+    # Check input (arrays of n_rebelays and n_cavers broadcast against each other)
+    n_cavers = check_n_cavers(n_cavers)
 
-    # Calculate length of each rebelay section
-    if n_rebelays > 0:
-        section_length = rope_length / (n_rebelays + 1)
-    else:
-        section_length = rope_length
+    # Calculate length of each rebelay section (the full length when there are no rebelays)
+    section_length = rope_length / (n_rebelays + 1)
 
     # Calculate time for each caver to ascend one section and transition to next section
     section_time = (section_length / ascent_speed) + transition_time
 
-    # Calculate time for the first caver to ascend entire length of rope
-    leader_time = section_time * (n_rebelays + 1)
-
-    # Add one additional section for every other caver in the group
-    total_time = leader_time + section_time * (n_cavers - 1)
+    # The first caver climbs all n_rebelays + 1 sections, and every other caver in the group
+    # adds one additional section behind them
+    total_time = section_time * (n_rebelays + n_cavers)
 
     # Return total time in minutes
     return total_time
@@ -1,37 +1,34 @@
-from ascent_time import ascent_time
+import numpy as np
+
+from ascent_time import check_n_cavers
 
 
 def optimum_rebelay(rope_length, n_cavers, ascent_speed=7, transition_time=2, max_number_rebelays=100):
     """
     Finds the optimum rebelay length that minimizes the ascent OR descent time.
 
+    The total time T = (L/(v*m) + t) * (m + n_cavers - 1), with m = n_rebelays + 1 sections,
+    is convex in m, so setting dT/dm = 0 gives the optimum directly: m = sqrt(L*(n_cavers-1)/(v*t)).
+
     Unique parameters:
-    max_number_rebelays (int, optional): the maximum number of rebelays to compute (default is 100)
+    n_cavers (int or array of int): the number of cavers in the group, an array gives the optimum for each group size
+    max_number_rebelays (int, optional): the maximum number of rebelays to consider (default is 100)
 
     Returns:
-    optimum_rebelay_length (float): the optimum rebelay length in meters that minimizes the ascent time
+    optimum_rebelay_length (float or array): the optimum rebelay length in meters that minimizes the ascent time
     """
 
-    import numpy as np
-    from scipy.interpolate import interp1d
+    # Check input
+    n_cavers = check_n_cavers(n_cavers)
 
-    # Set the range of rebelay numbers to iterate over
-    n_rebelays_range = range(0, max_number_rebelays)
+    # Optimum number of sections, limited to between the full rope and the maximum number of rebelays.
+    # With no transition time more sections are always better, unless there is a single caver (0/0)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        n_sections = np.sqrt(rope_length * (n_cavers - 1) / (ascent_speed * transition_time))
+    n_sections = np.nan_to_num(n_sections, nan=1, posinf=max_number_rebelays)
+    n_sections = np.clip(n_sections, 1, max_number_rebelays)
 
-    # Iterate over the range of rebelay numbers and calculate ascent times
-    ascent_times = []
-    rebelay_lengths = []
-    for n_rebelays in n_rebelays_range:
-        rebelay_length = rope_length / (n_rebelays + 1)
-        rebelay_lengths.append(rebelay_length)
-        time = ascent_time(rope_length, n_cavers, n_rebelays, ascent_speed, transition_time)
-        ascent_times.append(time)
-
-    # Find the minimum ascent time and the corresponding rebelay length using cubic interpolation
-    f = interp1d(rebelay_lengths, ascent_times, kind='cubic')
-    x_new = np.linspace(min(rebelay_lengths), max(rebelay_lengths), num=1000, endpoint=True)
-    y_new = f(x_new)
-    optimum_rebelay_length = round(x_new[np.argmin(y_new)], 1)
+    optimum_rebelay_length = np.round(rope_length / n_sections, 1)
 
     return optimum_rebelay_length
 
@@ -41,34 +38,60 @@ def optimum_rebelay_both_ways(rope_length, n_cavers, ascent_speed=7, descent_spe
     """
     Finds the optimum rebelay length that minimizes the COMBINED descent and ascent time.
 
+    Summing the ascent and descent times and setting the derivative to zero gives the optimum
+    number of sections directly: m = sqrt(L*(n_cavers-1)*(1/v_up + 1/v_down)/(2*t)).
+
     Unique parameters:
-    max_number_rebelays (int, optional): the maximum number of rebelays to compute (default is 100)
+    n_cavers (int or array of int): the number of cavers in the group, an array gives the optimum for each group size
+    max_number_rebelays (int, optional): the maximum number of rebelays to consider (default is 100)
 
     Returns:
-    optimum_rebelay_length (float): the optimum rebelay length in meters that minimizes the ascent time
+    optimum_rebelay_length (float or array): the optimum rebelay length in meters that minimizes the ascent time
     """
 
-    import numpy as np
-    from scipy.interpolate import interp1d
+    # Check input
+    n_cavers = check_n_cavers(n_cavers)
 
-    # Set the range of rebelay numbers to iterate over
-    n_rebelays_range = range(0, max_number_rebelays)
+    # Optimum number of sections, limited to between the full rope and the maximum number of rebelays.
+    # With no transition time more sections are always better, unless there is a single caver (0/0)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        n_sections = np.sqrt(rope_length * (n_cavers - 1) * (1/ascent_speed + 1/descent_speed) / (2 * transition_time))
+    n_sections = np.nan_to_num(n_sections, nan=1, posinf=max_number_rebelays)
+    n_sections = np.clip(n_sections, 1, max_number_rebelays)
 
-    # Iterate over the range of rebelay numbers and calculate ascent times
-    ascent_times = []
-    rebelay_lengths = []
-    for n_rebelays in n_rebelays_range:
-        rebelay_length = rope_length / (n_rebelays + 1)
-        rebelay_lengths.append(rebelay_length)
-        time_up = ascent_time(rope_length, n_cavers, n_rebelays, ascent_speed, transition_time)
-        time_down = ascent_time(rope_length, n_cavers, n_rebelays, descent_speed, transition_time)
+    optimum_rebelay_length = np.round(rope_length / n_sections, 1)
 
-        ascent_times.append(time_up+time_down)
+    return optimum_rebelay_length
 
-    # Find the minimum ascent time and the corresponding rebelay length using cubic interpolation
-    f = interp1d(rebelay_lengths, ascent_times, kind='cubic')
-    x_new = np.linspace(min(rebelay_lengths), max(rebelay_lengths), num=1000, endpoint=True)
-    y_new = f(x_new)
-    optimum_rebelay_length = round(x_new[np.argmin(y_new)], 1)
 
-    return optimum_rebelay_length
+
+def compute_optimum_curves(rope_length, max_cavers, ascent_speed=7, descent_speed=70, transition_time=2, max_rebelays=100):
+    """
+    Computes the optimum rebelay length as a function of the number of cavers for ascent, descent and both ways,
+    without plotting (i.e., without importing matplotlib).
+
+    Parameters:
+    rope_length (float): the total length of the rope in meters
+    max_cavers (int): the maximum number of cavers in the group
+    ascent_speed (float, optional): the ascent speed in meters per minute (default is 7)
+    descent_speed (float, optional): the descent speed in meters per minute (default is 70)
+    transition_time (float, optional): the time it takes for a caver to transition from one rebelay to the next in minutes (default is 2)
+    max_rebelays (int, optional): the maximum number of rebelays to consider (default is 100)
+
+    Returns:
+    cavers_range (array): the group sizes, from 1 to max_cavers
+    ascent_lengths (array): the optimum rebelay length for the ascent for each group size
+    both_lengths (array): the optimum rebelay length for the combined descent and ascent for each group size
+    descent_lengths (array): the optimum rebelay length for the descent for each group size
+    """
+
+    # Check input (the group sizes themselves are checked again by the optimum functions)
+    max_cavers = check_n_cavers(max_cavers, 'max_cavers')
+
+    cavers_range = np.arange(1, max_cavers+1)
+
+    ascent_lengths = optimum_rebelay(rope_length, cavers_range, ascent_speed, transition_time, max_rebelays)
+    both_lengths = optimum_rebelay_both_ways(rope_length, cavers_range, ascent_speed, descent_speed, transition_time, max_rebelays)
+    descent_lengths = optimum_rebelay(rope_length, cavers_range, descent_speed, transition_time, max_rebelays)
+
+    return cavers_range, ascent_lengths, both_lengths, descent_lengths
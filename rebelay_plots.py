@@ -1,8 +1,10 @@
+import numpy as np
+
 from ascent_time import ascent_time
-from optimum_rebelay import optimum_rebelay, optimum_rebelay_both_ways
+from optimum_rebelay import optimum_rebelay, compute_optimum_curves
 
 
-def plot_ascent_times(rope_length, n_cavers, ascent_speed=7, transition_time=2, max_number_rebelays=100):
+def plot_ascent_times(rope_length, n_cavers, ascent_speed=7, transition_time=2, max_number_rebelays=100, filename=None):
     """
     Plots the ascent times as a function of the length of a section (i.e., the rebelay length).
 
@@ -12,32 +14,21 @@ def plot_ascent_times(rope_length, n_cavers, ascent_speed=7, transition_time=2,
     ascent_speed (float, optional): the ascent speed in meters per minute (default is 7)
     transition_time (float, optional): the time it takes for a caver to transition from one rebelay to the next in minutes (default is 2)
     max_number_rebelays (int, optional): the maximum number of rebelays to compute (default is 100)
+    filename (str, optional): if given, the figure is saved to this file and closed instead of shown (default is None)
 
     Example usage:
     plot_ascent_times(rope_length=100, n_cavers=4, ascent_speed=7, transition_time=2)
     """
 
     import matplotlib.pyplot as plt
-    import numpy as np
-    from scipy.interpolate import interp1d
-
-    # Set the range of rebelay numbers to iterate over
-    n_rebelays_range = range(0, max_number_rebelays)
-
-    # Iterate over the range of rebelay numbers and calculate ascent times
-    ascent_times = []
-    rebelay_lengths = []
-    for n_rebelays in n_rebelays_range:
-        rebelay_length = rope_length / (n_rebelays + 1)
-        rebelay_lengths.append(rebelay_length)
-        time = ascent_time(rope_length, n_cavers, n_rebelays, ascent_speed, transition_time)
-        ascent_times.append(time)
-
-    # Find the minimum ascent time and the corresponding rebelay length using cubic interpolation
-    f = interp1d(rebelay_lengths, ascent_times, kind='cubic')
-    x_new = np.linspace(min(rebelay_lengths), max(rebelay_lengths), num=1000, endpoint=True)
-    y_new = f(x_new)
-    optimum_rebelay_length = round(x_new[np.argmin(y_new)], 1)
+
+    # Calculate the ascent times for the whole range of rebelay numbers at once
+    n_rebelays = np.arange(max_number_rebelays)
+    rebelay_lengths = rope_length / (n_rebelays + 1)
+    ascent_times = ascent_time(rope_length, n_cavers, n_rebelays, ascent_speed, transition_time)
+
+    # Find the rebelay length that minimizes the ascent time
+    optimum_rebelay_length = optimum_rebelay(rope_length, n_cavers, ascent_speed, transition_time, max_number_rebelays)
 
     # Plot the ascent times vs. the length of each rebelay section
     fig, ax = plt.subplots()
@@ -55,13 +46,17 @@ def plot_ascent_times(rope_length, n_cavers, ascent_speed=7, transition_time=2,
     props = dict(boxstyle='round', facecolor='white', alpha=0.8)
     plt.text(0.7, 0.95, textstr, transform=plt.gca().transAxes, fontsize=10, verticalalignment='top', bbox=props)
 
-    # Show
-    plt.show()
+    # Show, or save when running in batch
+    if filename is not None:
+        fig.savefig(filename)
+        plt.close(fig)
+    else:
+        plt.show()
 
 
 
 
-def plot_optimum_rebelay_length_both_ways(rope_length, max_cavers, ascent_speed=7, descent_speed=70, transition_time=2, max_rebelays=100):
+def plot_optimum_rebelay_length_both_ways(rope_length, max_cavers, ascent_speed=7, descent_speed=70, transition_time=2, max_rebelays=100, filename=None):
     """
     Plots the optimum rebelay length as a function of the number of cavers for ascent, descent and both ways.
 
@@ -72,50 +67,23 @@ def plot_optimum_rebelay_length_both_ways(rope_length, max_cavers, ascent_speed=
     descent_speed (float, optional): the descent speed in meters per minute (default is 70)
     transition_time (float, optional): the time it takes for a caver to transition from one rebelay to the next in minutes (default is 2)
     max_rebelays (int, optional): the maximum number of rebelays to compute (default is 100)
+    filename (str, optional): if given, the figure is saved to this file and closed instead of shown (default is None)
 
     Example usage:
     plot_optimum_rebelay_length_both_ways(rope_length=80, max_cavers=8, transition_time=2, max_rebelays=100)
     """
 
     import matplotlib.pyplot as plt
-    import numpy as np
 
-    # Compute ascent
+    # Compute the optimum rebelay length for every group size for ascent, both ways and descent
+    cavers_range, ascent_lengths, both_lengths, descent_lengths = compute_optimum_curves(
+        rope_length, max_cavers, ascent_speed, descent_speed, transition_time, max_rebelays)
 
-    # Set the range of cavers and iterate over them to find the optimum rebelay length for each group size
-    cavers_range = range(1, max_cavers+1)
-    optimum_rebelay_lengths = []
-    for n_cavers in cavers_range:
-        optimum_rebelay_length = optimum_rebelay(rope_length, n_cavers, ascent_speed, transition_time, max_rebelays)
-        optimum_rebelay_lengths.append(optimum_rebelay_length)
     # Plot the optimum rebelay length vs. the number of cavers
     fig, ax = plt.subplots()
-    sc1 = ax.scatter(cavers_range, optimum_rebelay_lengths, color='#FF0000', marker='^', label='Ascent')
-
-
-    # Compute both
-
-    # Set the range of cavers and iterate over them to find the optimum rebelay length for each group size
-    cavers_range = range(1, max_cavers+1)
-    optimum_rebelay_lengths = []
-    for n_cavers in cavers_range:
-        optimum_rebelay_length = optimum_rebelay_both_ways(rope_length, n_cavers, ascent_speed, descent_speed, transition_time=2, max_number_rebelays=100)
-        optimum_rebelay_lengths.append(optimum_rebelay_length)
-    # Plot the optimum rebelay length vs. the number of cavers
-    sc2 = ax.scatter(cavers_range, optimum_rebelay_lengths, color='#000000', marker='d', label='Both')
-
-
-    # Compute descent
-
-    # Set the range of cavers and iterate over them to find the optimum rebelay length for each group size
-    cavers_range = range(1, max_cavers+1)
-    optimum_rebelay_lengths = []
-    for n_cavers in cavers_range:
-        optimum_rebelay_length = optimum_rebelay(rope_length, n_cavers, descent_speed, transition_time, max_rebelays)
-        optimum_rebelay_lengths.append(optimum_rebelay_length)
-    # Plot the optimum rebelay length vs. the number of cavers
-    sc2 = ax.scatter(cavers_range, optimum_rebelay_lengths, color='#0037FF', marker='v', label='Descent')
-
+    ax.scatter(cavers_range, ascent_lengths, color='#FF0000', marker='^', label='Ascent')
+    ax.scatter(cavers_range, both_lengths, color='#000000', marker='d', label='Both')
+    ax.scatter(cavers_range, descent_lengths, color='#0037FF', marker='v', label='Descent')
 
     # Complete the figure
     ax.set_xlabel('Number of cavers')
@@ -125,7 +93,14 @@ def plot_optimum_rebelay_length_both_ways(rope_length, max_cavers, ascent_speed=
     plt.legend()
     ax.set_axisbelow(True)
     ax.grid(True, linestyle='--')
-    plt.show()
+
+    # Show, or save when running in batch
+    if filename is not None:
+        fig.savefig(filename)
+        plt.close(fig)
+    else:
+        plt.show()
 
 
-plot_optimum_rebelay_length_both_ways(rope_length=80, max_cavers=8, transition_time=2, max_rebelays=100)
+if __name__ == "__main__":
+    plot_optimum_rebelay_length_both_ways(rope_length=80, max_cavers=8, transition_time=2, max_rebelays=100)